@@ -4,7 +4,7 @@ from .security_agent import SecurityAgent
 from .cost_agent import CostAgent
 from .operational_agent import OperationalAgent
 from .performance_agent import PerformanceAgent
-from .pillar_agent_base import BasePillarAgent, PillarAssessment
+from .pillar_agent_base import AgentFrameworkUnavailableError, BasePillarAgent, PillarAssessment
 
 __all__ = [
     "ReliabilityAgent",
@@ -14,5 +14,6 @@ __all__ = [
     "PerformanceAgent",
     "BasePillarAgent",
     "PillarAssessment",
+    "AgentFrameworkUnavailableError",
 ]
 
@@ -56,6 +56,37 @@ except ImportError:
     OTEL_AVAILABLE = False
     trace = None
 
+# orjson parses/serializes LLM payloads several times faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Decode JSON text, preferring orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj: Any, *, indent: bool = False) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON bytes (2-space indent when ``indent``)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+# Severity (1 = most urgent .. 5) indexed by impact_score clamped to 0..10:
+# 9-10 -> 1, 7-8 -> 2, 5-6 -> 3, 3-4 -> 4, 0-2 -> 5
+IMPACT_SEVERITY: Tuple[int, ...] = (5, 5, 5, 4, 4, 3, 3, 2, 2, 1, 1)
+
+
+class AgentFrameworkUnavailableError(RuntimeError):
+    """Raised when a pillar agent is constructed without the Microsoft Agent Framework."""
+
 
 @dataclass
 class PillarAssessment:
@@ -92,7 +123,7 @@ class BasePillarAgent:
         enable_mcp: bool = True,
     ) -> None:
         if not AGENT_FRAMEWORK_AVAILABLE:
-            raise SystemExit(
+            raise AgentFrameworkUnavailableError(
                 "Microsoft Agent Framework is required. Install the 'agent-framework' package "
                 "to run Well-Architected pillar agents."
             )
@@ -224,27 +255,22 @@ class BasePillarAgent:
             len(architecture_content or ""),
         )
 
-        references: List[Dict[str, str]] = []
-        if self.mcp_manager and self.enable_mcp:
-            try:
-                docs = await self.mcp_manager.get_service_documentation(self.pillar_code, self.mcp_topic)
-                references = [{"title": d.get("title", ""), "url": d.get("url", "")} for d in docs[:3]]
-                logger.info("Retrieved %d MCP documentation references", len(references))
-                for idx, ref in enumerate(references):
-                    logger.info("  Doc [%d]: %s - %s", idx + 1, ref.get("title", "")[:60], ref.get("url", ""))
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.warning("MCP lookup failed for %s: %s", self.pillar_code, exc)
-
         prompt = self._render_prompt(architecture_content)
         logger.info(
-            "Sending assessment prompt to agent | pillar=%s | prompt_length=%d | architecture_length=%d | references=%d",
+            "Sending assessment prompt to agent | pillar=%s | prompt_length=%d | architecture_length=%d",
             self.pillar_code,
             len(prompt),
             len(architecture_content),
-            len(references)
         )
         logger.debug("Prompt preview (first 300 chars): %s", prompt[:300])
-        
+
+        # The prompt does not embed MCP references, so the LLM call and the documentation
+        # lookup are independent I/O and run concurrently.
+        references, result = await asyncio.gather(
+            self._fetch_mcp_references(),
+            self.agent.run(prompt),
+        )
+
         # Log MCP reference URLs for tracing
         if references:
             logger.info("MCP documentation references being used:")
@@ -272,7 +298,6 @@ class BasePillarAgent:
                     attributes=event_attributes
                 )
         
-        result = await self.agent.run(prompt)
         logger.debug("Raw agent response type=%s", type(result))
         text = getattr(result, "text", str(result))
         logger.info("Agent response received | output_length=%d", len(text))
@@ -311,6 +336,21 @@ class BasePillarAgent:
         
         return assessment
 
+    async def _fetch_mcp_references(self) -> List[Dict[str, str]]:
+        """Return up to three MCP documentation references (empty if disabled or failed)."""
+        if not (self.mcp_manager and self.enable_mcp):
+            return []
+        try:
+            docs = await self.mcp_manager.get_service_documentation(self.pillar_code, self.mcp_topic)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("MCP lookup failed for %s: %s", self.pillar_code, exc)
+            return []
+        references = [{"title": d.get("title", ""), "url": d.get("url", "")} for d in docs[:3]]
+        logger.info("Retrieved %d MCP documentation references", len(references))
+        for idx, ref in enumerate(references):
+            logger.info("  Doc [%d]: %s - %s", idx + 1, ref.get("title", "")[:60], ref.get("url", ""))
+        return references
+
     # NEW: Optional pathway including Azure Support Cases CSV context
     async def assess_architecture_with_cases(self, architecture_content: str, support_cases_path: Optional[Path] = None) -> PillarAssessment:
         """Assess architecture augmented with Azure support cases context.
@@ -463,7 +503,7 @@ class BasePillarAgent:
         end = text.rfind("}") + 1
         if start == -1 or end <= start:
             raise ValueError("Agent response did not include a JSON object")
-        return json.loads(text[start:end])
+        return json_loads(text[start:end])
 
     def _normalize_domain_scores(self, raw_scores: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         normalized: Dict[str, Dict[str, Any]] = {}
@@ -513,15 +553,7 @@ class BasePillarAgent:
             impact_int = None
         if impact_int is None:
             return 5
-        if impact_int >= 9:
-            return 1
-        if impact_int >= 7:
-            return 2
-        if impact_int >= 5:
-            return 3
-        if impact_int >= 3:
-            return 4
-        return 5
+        return IMPACT_SEVERITY[max(0, min(impact_int, 10))]
 
     # ------------------------------------------------------------------
     # Markdown helpers
@@ -653,8 +685,9 @@ class BasePillarAgent:
             "mcp_references": assessment.mcp_references,
             "timestamp": assessment.timestamp,
         }
-        js_file.write_text(json.dumps(json_data, indent=2), encoding="utf-8")
-        logger.info("JSON artifact written | path=%s | bytes=%d", js_file, len(json.dumps(json_data)))
+        payload = json_dumps_bytes(json_data, indent=True)
+        js_file.write_bytes(payload)
+        logger.info("JSON artifact written | path=%s | bytes=%d", js_file, len(payload))
 
         return {"markdown": md_file, "json": js_file}
 
@@ -4,7 +4,7 @@ import asyncio
 import logging
 from backend.app.utils.logging_config import init_logging
 
-from .pillar_agent_base import BasePillarAgent
+from .pillar_agent_base import BasePillarAgent, json_dumps_bytes
 from .reliability_constants import DOMAIN_TITLES, PILLAR_CODE, PILLAR_PREFIX
 
 
@@ -77,7 +77,6 @@ class ReliabilityAgent(BasePillarAgent):
             output_dir: Output directory path
         """
         from pathlib import Path
-        import json
         
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
@@ -97,7 +96,7 @@ class ReliabilityAgent(BasePillarAgent):
             "timestamp": assessment.timestamp,
         }
         json_file = output_path / "reliability_assessment.json"
-        json_file.write_text(json.dumps(json_data, indent=2), encoding="utf-8")
+        json_file.write_bytes(json_dumps_bytes(json_data, indent=True))
         
         return {
             "markdown": str(markdown_file),
@@ -11,6 +11,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 import os
+import sys
 import time
 
 FAST_DEFAULT = "gpt-4o-mini"
@@ -47,6 +48,15 @@ class AzureOpenAISettings:
     # Heuristic threshold
     fast_token_threshold: int = TOKEN_SWITCH_THRESHOLD
 
+    def __post_init__(self) -> None:
+        # Deployment names are chosen on every chat request; intern them once so routing
+        # hands back the same string objects instead of allocating per call.
+        self.chat_fast_deployment = sys.intern(self.chat_fast_deployment)
+        self.chat_quality_deployment = sys.intern(self.chat_quality_deployment)
+        self.embedding_deployment = sys.intern(self.embedding_deployment)
+        if self.vision_deployment:
+            self.vision_deployment = sys.intern(self.vision_deployment)
+
     def choose_chat_deployment(self, prompt_token_estimate: int) -> str:
         if prompt_token_estimate < self.fast_token_threshold:
             return self.chat_fast_deployment
@@ -18,7 +18,7 @@ import json
 import logging
 import hashlib
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 try:
     # We attempt to import AsyncAzureOpenAI lazily; if unavailable tests can mock
@@ -30,6 +30,9 @@ from backend.app.config.azure_openai import AzureOpenAISettings, TokenBucket
 
 logger = logging.getLogger(__name__)
 
+# Texts at or below this length are used directly as embedding cache keys (no hashing).
+SMALL_TEXT_KEY_MAX = 64
+
 
 class LLMProvider:
     def __init__(self, settings: AzureOpenAISettings, client: Optional[Any] = None) -> None:
@@ -37,7 +40,7 @@ class LLMProvider:
         self.client = client  # May be None in test contexts; methods will short-circuit
         self._bucket = TokenBucket(settings.per_second_rate_limit)
         self._sem = asyncio.Semaphore(settings.max_concurrent_requests)
-        self._embed_cache: Dict[str, List[float]] = {}
+        self._embed_cache: Dict[Union[str, bytes], List[float]] = {}
 
     # -------------------- Public API --------------------
     async def chat(self, messages: List[Dict[str, str]], force_mode: Optional[str] = None) -> Dict[str, Any]:
@@ -74,28 +77,38 @@ class LLMProvider:
             return []
         if not self.client:
             return []
-        # Cache lookup
-        results: List[List[float]] = []
-        to_fetch: List[str] = []
-        for t in texts:
-            h = self._hash_text(t)
-            if h in self._embed_cache:
-                results.append(self._embed_cache[h])
+        # Cache lookup: fill a preallocated, input-ordered result slot per text
+        keys = [self._cache_key(t) for t in texts]
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        missing: List[int] = []
+        for i, key in enumerate(keys):
+            vec = self._embed_cache.get(key)
+            if vec is None:
+                missing.append(i)
             else:
-                to_fetch.append(t)
-        if to_fetch:
+                results[i] = vec
+        if missing:
+            to_fetch = [texts[i] for i in missing]
             fetched = await self._run_with_retry(
                 op="embed",
                 fn=lambda: self.client.embeddings.create(model=self.settings.embedding_deployment, input=to_fetch),
                 meta={"count": len(to_fetch)},
             )
-            data = fetched.get("data") or getattr(fetched, "data", [])
-            for original, item in zip(to_fetch, data):
+            data = list((fetched.get("data") if isinstance(fetched, dict) else getattr(fetched, "data", None)) or [])
+            if len(data) != len(missing):
+                # Vectors can't be paired with their inputs; callers fall back on an empty result
+                logger.warning("embed: expected %d vectors, got %d; discarding batch", len(missing), len(data))
+                return []
+            for i, item in zip(missing, data):
                 vec = item.get("embedding") if isinstance(item, dict) else getattr(item, "embedding", None)
                 if vec:
-                    self._embed_cache[self._hash_text(original)] = vec
-                    results.append(vec)
-        return results
+                    self._embed_cache[keys[i]] = vec
+                    results[i] = vec
+        if any(vec is None for vec in results):
+            logger.warning("embed: %d of %d texts returned no embedding; discarding batch",
+                           sum(vec is None for vec in results), len(results))
+            return []
+        return results  # type: ignore[return-value]
 
     # -------------------- Internal Helpers --------------------
     def _select_deployment(self, prompt_tokens: int, force_mode: Optional[str]) -> str:
@@ -145,8 +158,12 @@ class LLMProvider:
     def _consume_token(self) -> bool:
         return self._bucket.consume(1)
 
-    def _hash_text(self, text: str) -> str:
-        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    def _cache_key(self, text: str) -> Union[str, bytes]:
+        # Short texts key the cache directly; longer ones use a raw SHA256 digest. Digests are
+        # bytes, so they can never collide with a str key.
+        if len(text) <= SMALL_TEXT_KEY_MAX:
+            return text
+        return hashlib.sha256(text.encode("utf-8")).digest()
 
     def _log_event(self, op: str, attempt: int, latency_ms: int, meta: Dict[str, Any], success: bool, error: Optional[str] = None) -> None:
         payload = {
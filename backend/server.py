@@ -8,10 +8,13 @@ that produces deterministic stub scores and recommendations.
 from __future__ import annotations
 
 import asyncio
+import copy
 import csv
 import datetime as dt
+import hashlib
 import io
 import os
+import re
 import traceback
 import base64
 from pathlib import Path
@@ -30,6 +33,12 @@ try:
 except ImportError:
     PYMUPDF_AVAILABLE = False
 
+try:
+    import ahocorasick  # pyahocorasick: single-pass multi-keyword matching
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
@@ -536,6 +545,16 @@ async def delete_assessment(aid: str):
         return {"status": "deleted", "id": aid}
 
 
+# Statuses from which start_analysis (re)starts; the document set is frozen otherwise.
+DOCUMENT_EDITABLE_STATUSES = ("pending", "failed")
+
+
+def _ensure_documents_editable(assessment: Dict[str, Any]) -> None:
+    status = assessment.get("status", "pending")
+    if status not in DOCUMENT_EDITABLE_STATUSES:
+        raise HTTPException(400, f"Cannot delete documents once analysis has started (status: {status})")
+
+
 @app.delete("/api/assessments/{aid}/documents/{doc_id}")
 async def delete_document(aid: str, doc_id: str):
     if mongo_db is not None:
@@ -544,6 +563,7 @@ async def delete_document(aid: str, doc_id: str):
             doc = await mongo_db["assessments"].find_one({"id": aid})
             if not doc:
                 raise HTTPException(404, "assessment not found")
+            _ensure_documents_editable(doc)
             
             # Remove document from documents array
             documents = doc.get("documents", [])
@@ -570,6 +590,7 @@ async def delete_document(aid: str, doc_id: str):
         assessment = ASSESSMENTS.get(aid)
         if not assessment:
             raise HTTPException(404, "assessment not found")
+        _ensure_documents_editable(assessment)
         
         documents = assessment.get("documents", [])
         original_count = len(documents)
@@ -678,8 +699,9 @@ async def upload_documents(aid: str, files: List[UploadFile] = File(...)):
         if not doc:
             raise HTTPException(404, "assessment not found")
     
-    # Initialize DocumentAnalyzer
-    analyzer = DocumentAnalyzer(llm_enabled=True)
+    # DocumentAnalyzer (and its inline Azure OpenAI client) is only needed for
+    # case/diagram files; plain architecture text is stored as-is.
+    analyzer: Optional[DocumentAnalyzer] = None
     documents: List[Document] = []
     
     for uf in files:
@@ -695,9 +717,6 @@ async def upload_documents(aid: str, files: List[UploadFile] = File(...)):
             print(f"[thumbnail] Generated for {uf.filename} size={len(thumbnail_url)}")
         else:
             print(f"[thumbnail] None generated for {uf.filename} (category={category})")
-        
-        # Generate thumbnail
-        thumbnail_url = _generate_thumbnail(file_bytes, uf.filename, uf.content_type or "", category)
 
         analysis_result: Dict[str, Any] = {}
         llm_analysis: str = ""
@@ -718,6 +737,7 @@ async def upload_documents(aid: str, files: List[UploadFile] = File(...)):
                 llm_analysis = ""  # No LLM analysis at upload time
                 structured_report = None
             elif category == "case":
+                analyzer = analyzer or DocumentAnalyzer(llm_enabled=True)
                 analysis_result = await analyzer.analyze_support_cases(text_fallback, uf.filename)
                 llm_analysis = analysis_result.get("llm_analysis", "")
                 structured_report = analysis_result.get("structured_report")
@@ -767,6 +787,7 @@ async def upload_documents(aid: str, files: List[UploadFile] = File(...)):
                         lines.append(f"(+{remaining_r} more risks)")
                 support_cases_summary = "\n".join(lines) if lines else "No structured patterns detected"
             elif category == "diagram":
+                analyzer = analyzer or DocumentAnalyzer(llm_enabled=True)
                 analysis_result = await analyzer.analyze_diagram(file_bytes, uf.filename, uf.content_type or "")
                 llm_analysis = analysis_result.get("llm_analysis", "")
                 raw_extracted_text = analysis_result.get("extracted_text")
@@ -1261,7 +1282,277 @@ async def _update_phase(aid: str, phase: str):
         ASSESSMENTS[aid] = a
 
 
-def _calculate_conservative_score(corpus: str, code: str, name: str) -> tuple[int, str, Dict[str, int], str, float, int, Dict[str, Any]]:
+# Pillar-specific concepts with weights (critical vs. important)
+PILLAR_CONCEPTS: Dict[str, Dict[str, List[str]]] = {
+    "reliability": {
+        "critical": ["redundancy", "failover", "backup", "disaster recovery", "availability"],
+        "important": ["replica", "multi-region", "health check", "monitoring", "sla"],
+        "nice_to_have": ["resiliency", "chaos engineering", "circuit breaker"]
+    },
+    "security": {
+        "critical": ["encryption", "authentication", "authorization", "key vault"],
+        "important": ["rbac", "network security", "firewall", "identity", "secret"],
+        "nice_to_have": ["zero trust", "threat detection", "compliance", "audit"]
+    },
+    "cost": {
+        "critical": ["cost", "pricing", "budget"],
+        "important": ["optimization", "reserved instance", "tagging", "monitoring"],
+        "nice_to_have": ["autoscaling", "rightsizing", "spot instance"]
+    },
+    "operational": {
+        "critical": ["monitoring", "logging", "deployment"],
+        "important": ["ci/cd", "pipeline", "automation", "alerting"],
+        "nice_to_have": ["infrastructure as code", "gitops", "observability"]
+    },
+    "performance": {
+        "critical": ["latency", "throughput", "scalability"],
+        "important": ["cache", "cdn", "load balancing", "indexing"],
+        "nice_to_have": ["compression", "optimization", "query tuning"]
+    }
+}
+
+# Advanced practice patterns (gates for >80 / >90 bands)
+ADVANCED_PATTERNS: Dict[str, List[str]] = {
+    "reliability": ["rto", "rpo", "chaos", "fault injection", "circuit breaker", "active-active", "quorum"],
+    "security": ["threat modeling", "penetration test", "key rotation", "purple team", "conditional access", "managed identity", "waf", "ddos"],
+    "cost": ["anomaly detection", "chargeback", "showback", "finops", "reserved instance", "rightsizing", "spot", "commitment"],
+    "operational": ["runbook", "auto-remediation", "error budget", "postmortem", "canary", "blue-green", "slo", "on-call"],
+    "performance": ["p95", "p99", "benchmark", "capacity planning", "profiling", "load test", "stress test", "query optimization"]
+}
+
+# Verbs signalling concrete implementation (pillar independent)
+IMPLEMENTATION_VERBS = ["deploy", "automate", "monitor", "test", "enforce", "rotate", "scan", "instrument", "benchmark", "backup", "restore", "replicate", "harden", "patch"]
+
+
+def _pillar_keywords(code: str) -> List[str]:
+    """Every keyword the conservative scorer looks up for a pillar."""
+    tiers = PILLAR_CONCEPTS.get(code, {})
+    return [w for tier in tiers.values() for w in tier] + ADVANCED_PATTERNS.get(code, []) + IMPLEMENTATION_VERBS
+
+
+def _build_concept_automatons() -> Dict[str, Any]:
+    """Build one Aho-Corasick automaton per pillar over every scored keyword.
+
+    A single pass over the corpus then yields all concept, advanced-pattern and
+    implementation-verb hits at once instead of one substring scan per keyword.
+    """
+    automatons: Dict[str, Any] = {}
+    if not AHOCORASICK_AVAILABLE:
+        return automatons
+    for pillar in PILLAR_CONCEPTS:
+        automaton = ahocorasick.Automaton()
+        for word in _pillar_keywords(pillar):
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        automatons[pillar] = automaton
+    return automatons
+
+
+_CONCEPT_AUTOMATONS = _build_concept_automatons()
+
+
+def _keyword_hits(corpus_lower: str, code: str) -> set:
+    """Return the set of the pillar's scored keywords that occur in corpus_lower."""
+    automaton = _CONCEPT_AUTOMATONS.get(code)
+    if automaton is not None:
+        return {word for _, word in automaton.iter(corpus_lower)}
+    # Fallback without pyahocorasick (or for unknown pillars): one substring scan per keyword
+    return {w for w in _pillar_keywords(code) if w in corpus_lower}
+
+
+# Semantic alias rules per pillar: (alias, trigger groups). A rule fires when every
+# group has at least one trigger in the corpus; the alias is then appended so the
+# concept checks pick up synonyms (e.g. "health probe" -> "health check").
+SEMANTIC_ALIAS_RULES: Dict[str, List[tuple]] = {
+    "performance": [
+        ("load balancing", (("load balancer",),)),
+        ("scalability", (("hpa", "horizontal pod autoscaler", "cluster autoscaler"),)),
+        ("throughput", (("capacity & demand planning", "capacity planning"),)),
+        ("monitoring", (("cpu",), ("alert",))),
+        ("optimization", (("profil",),)),  # profiling / profile
+        # Extended performance aliases
+        ("latency", (("p95", "p99", "percentile", "response time"),)),
+        ("throughput", (("queue depth", "queue length", "message backlog"),)),
+        ("throughput", (("requests per second", "rps", "transactions per second", "tps"),)),
+        ("scalability", (("connection pool", "thread pool", "worker pool"),)),
+        ("query tuning", (("query optimization", "index tuning", "execution plan"),)),
+    ],
+    "reliability": [
+        ("redundancy", (("single point of failure",),)),
+        ("failover", (("traffic manager", "front door"),)),
+        ("disaster recovery", (("site recovery",),)),
+        ("availability", (("availability zone", "zone-redundant"),)),
+        ("resiliency", (("self-healing", "auto-repair"),)),
+        ("health check", (("health probe",),)),
+        ("availability", (("sla",), ("uptime",))),
+        # Extended reliability aliases
+        ("disaster recovery", (("rto", "recovery time objective"),)),
+        ("backup", (("rpo", "recovery point objective"),)),
+        ("failover", (("active-active", "active-passive", "standby"),)),
+        ("resiliency", (("partition tolerance", "split-brain", "quorum"),)),
+        ("chaos engineering", (("chaos monkey", "fault injection", "failure testing"),)),
+    ],
+    "security": [
+        ("network security", (("private endpoint",),)),
+        ("threat detection", (("defender for cloud", "microsoft defender"),)),
+        ("threat detection", (("sentinel", "siem"),)),
+        ("authorization", (("pim", "privileged identity"),)),
+        ("authentication", (("mfa", "multi-factor authentication"),)),
+        ("authorization", (("conditional access", "least privilege"),)),
+        # Extended security aliases
+        ("threat detection", (("penetration test", "pen test", "vulnerability scan"),)),
+        ("firewall", (("waf", "web application firewall", "ddos protection"),)),
+        ("compliance", (("security baseline", "cis benchmark", "hardening"),)),
+        ("key vault", (("secrets rotation", "credential rotation"),)),
+        ("encryption", (("tls", "ssl", "https", "encryption in transit"),)),
+    ],
+    "operational": [
+        ("deployment", (("infrastructure as code", "bicep", "terraform"),)),
+        ("automation", (("runbook",),)),
+        ("monitoring", (("observability",),)),
+        ("deployment", (("blue-green", "canary"),)),
+        # Extended operational aliases
+        ("automation", (("runbook automation", "automated remediation", "self-service"),)),
+        ("deployment", (("change management", "change control", "change approval"),)),
+        ("alerting", (("incident management", "on-call", "pagerduty"),)),
+        ("monitoring", (("sre", "site reliability", "error budget"),)),
+        ("observability", (("distributed tracing", "correlation id", "trace context"),)),
+    ],
+    "cost": [
+        ("reserved instance", (("reserved instance", "savings plan"),)),
+        ("optimization", (("rightsizing", "right-sizing"),)),
+        ("optimization", (("lifecycle policy",),)),
+        ("cost", (("finops",),)),
+        # Extended cost aliases
+        ("monitoring", (("cost anomaly", "anomaly detection", "spend anomaly"),)),
+        ("tagging", (("chargeback", "showback", "cost allocation"),)),
+        ("spot instance", (("spot instance", "spot vm", "low-priority"),)),
+        ("reserved instance", (("commitment", "azure hybrid benefit", "ahb"),)),
+        ("optimization", (("waste", "orphaned resource", "idle resource"),)),
+    ],
+}
+
+
+def _semantic_aliases(corpus_lower: str, code: str) -> List[str]:
+    """Sorted, de-duplicated aliases whose triggers appear in corpus_lower."""
+    aliases = {
+        alias
+        for alias, groups in SEMANTIC_ALIAS_RULES.get(code, ())
+        if all(any(t in corpus_lower for t in group) for group in groups)
+    }
+    return sorted(aliases)
+
+
+# Regexes used on every scoring pass, compiled once at import
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]")
+_METRIC_PAIR_RE = re.compile(r"\b\d+(?:\.\d+)?\s*(?:ms|s|sec|seconds|minutes|hours|days|%|gb|tb|mbps|rps|tps|qps|sla|cost|usd|\$)\b")
+_WORD_RE = re.compile(r"[A-Za-z]+")
+
+
+# Detect ACTUAL implementation gaps (things that are broken/missing).
+# These are BAD and should be penalized
+ACTUAL_GAP_PATTERNS = [
+    "not configured", "not enabled", "not implemented", "disabled", "manual only",
+    "not yet", "doesn't have", "lacks", "anti-pattern", "known issue",
+    "technical debt", "backup not configured", "backup missing",
+    "disaster recovery not configured", "dr not configured",
+    "redundancy not configured", "failover not configured",
+    "encryption not enabled", "encryption disabled",
+    "monitoring not configured", "logging not enabled",
+    "mfa not configured", "rbac not implemented"
+]
+
+# Positive negations - these are GOOD security/reliability practices
+# Should NOT be penalized (e.g., "no public internet" is GOOD)
+POSITIVE_NEGATIONS = [
+    "no public", "no internet", "no external access", "no direct access",
+    "no single point", "no hardcoded", "no plaintext", "no unencrypted",
+    "no manual", "no downtime", "zero downtime", "no data loss"
+]
+
+
+# Critical implementation gaps (phrased to avoid false positives from well-architected descriptions)
+CRITICAL_GAP_PATTERNS = [
+    "backup not configured", "no backup policy", "backup missing",
+    "disaster recovery not configured", "dr not configured",
+    "redundancy not configured", "failover not configured",
+    "encryption not enabled", "encryption disabled",
+    "monitoring not configured", "logging not enabled",
+    "single region only", "not multi-region",
+    "missing critical"
+]
+
+
+def _build_pattern_automaton(patterns: List[str]) -> Any:
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+_GAP_AUTOMATON = _build_pattern_automaton(ACTUAL_GAP_PATTERNS)
+_CRITICAL_GAP_AUTOMATON = _build_pattern_automaton(CRITICAL_GAP_PATTERNS)
+
+
+def _count_pattern_occurrences(text: str, patterns: List[str], automaton: Any) -> int:
+    """Sum of ``text.count(p)`` over patterns, in one automaton pass when available.
+
+    Occurrences of the same pattern that overlap an earlier match are skipped so
+    the total matches str.count's non-overlapping semantics.
+    """
+    if automaton is None:
+        return sum(text.count(pattern) for pattern in patterns)
+    count = 0
+    last_end: Dict[str, int] = {}
+    for end, pattern in automaton.iter(text):
+        if end - len(pattern) >= last_end.get(pattern, -1):
+            last_end[pattern] = end
+            count += 1
+    return count
+
+
+def _count_gap_mentions(corpus_lower: str) -> int:
+    """Count gap-pattern occurrences after stripping positive negations."""
+    cleaned = corpus_lower
+    for pos_neg in POSITIVE_NEGATIONS:
+        cleaned = cleaned.replace(pos_neg, "")
+    return _count_pattern_occurrences(cleaned, ACTUAL_GAP_PATTERNS, _GAP_AUTOMATON)
+
+
+def _count_critical_gaps(corpus_lower: str) -> int:
+    """Count critical-gap phrase occurrences in the (unstripped) lowercased corpus."""
+    return _count_pattern_occurrences(corpus_lower, CRITICAL_GAP_PATTERNS, _CRITICAL_GAP_AUTOMATON)
+
+
+# Memo of _calculate_conservative_score results keyed by (corpus digest, pillar code, name).
+# Scoring is a pure function of its inputs, so rescoring an unchanged corpus skips the keyword scan.
+CONSERVATIVE_SCORE_CACHE_MAX = 512
+_CONSERVATIVE_SCORE_CACHE: Dict[tuple, tuple] = {}
+
+
+def _calculate_conservative_score(corpus: str, code: str, name: str, corpus_lower: Optional[str] = None) -> tuple[int, str, Dict[str, int], str, float, int, Dict[str, Any]]:
+    """Memoized front for _compute_conservative_score (see there for the scoring approach).
+
+    The corpus is keyed by a 16-byte BLAKE2b digest so large documents are not retained as
+    cache keys. Callers receive a deep copy, so mutating the returned dicts cannot leak into
+    later hits. Callers scoring one corpus for several pillars may pass ``corpus_lower``
+    (``corpus.lower()``) so it is computed once rather than per pillar.
+    """
+    key = (hashlib.blake2b(corpus.encode("utf-8"), digest_size=16).digest(), code, name)
+    result = _CONSERVATIVE_SCORE_CACHE.get(key)
+    if result is None:
+        result = _compute_conservative_score(corpus, code, name, corpus_lower)
+        if len(_CONSERVATIVE_SCORE_CACHE) >= CONSERVATIVE_SCORE_CACHE_MAX:
+            # Evict the oldest entry (dicts preserve insertion order)
+            _CONSERVATIVE_SCORE_CACHE.pop(next(iter(_CONSERVATIVE_SCORE_CACHE)))
+        _CONSERVATIVE_SCORE_CACHE[key] = result
+    return copy.deepcopy(result)
+
+
+def _compute_conservative_score(corpus: str, code: str, name: str, corpus_lower: Optional[str] = None) -> tuple[int, str, Dict[str, int], str, float, int, Dict[str, Any]]:
     """
     Evidence-based scoring with confidence metric.
     
@@ -1280,7 +1571,8 @@ def _calculate_conservative_score(corpus: str, code: str, name: str) -> tuple[in
         - Absence penalties: gaps in evidence reduce score
         - Implementation vs mention: distinguishes "no X configured" from "X properly configured"
     """
-    corpus_lower = corpus.lower()
+    if corpus_lower is None:
+        corpus_lower = corpus.lower()  # the only case-folded copy; all scans below reuse it
     # Detailed breakdown structure (bottom-up justification)
     breakdown: Dict[str, Any] = {
         "pillar": code,
@@ -1293,211 +1585,28 @@ def _calculate_conservative_score(corpus: str, code: str, name: str) -> tuple[in
     corpus_size = len(corpus)
 
     # Semantic alias enrichment (helps detect evidence even if synonyms used)
-    if code == "performance":
-        alias_tokens = []
-        if "load balancer" in corpus_lower:
-            alias_tokens.append("load balancing")
-        if any(x in corpus_lower for x in ["hpa", "horizontal pod autoscaler", "cluster autoscaler"]):
-            alias_tokens.append("scalability")
-        if any(x in corpus_lower for x in ["capacity & demand planning", "capacity planning"]):
-            alias_tokens.append("throughput")
-        if "cpu" in corpus_lower and "alert" in corpus_lower:
-            alias_tokens.append("monitoring")
-        if "profil" in corpus_lower:  # profiling / profile
-            alias_tokens.append("optimization")
-        # Extended performance aliases
-        if any(x in corpus_lower for x in ["p95", "p99", "percentile", "response time"]):
-            alias_tokens.append("latency")
-        if any(x in corpus_lower for x in ["queue depth", "queue length", "message backlog"]):
-            alias_tokens.append("throughput")
-        if any(x in corpus_lower for x in ["requests per second", "rps", "transactions per second", "tps"]):
-            alias_tokens.append("throughput")
-        if any(x in corpus_lower for x in ["connection pool", "thread pool", "worker pool"]):
-            alias_tokens.append("scalability")
-        if any(x in corpus_lower for x in ["query optimization", "index tuning", "execution plan"]):
-            alias_tokens.append("query tuning")
-        if alias_tokens:
-            # Append aliases to corpus_lower so downstream simple 'in' checks pick them up
-            corpus_lower += " " + " ".join(sorted(set(alias_tokens)))
-            print(f"[semantic-alias] performance: added aliases {sorted(set(alias_tokens))}")
-
-    # --- Synonym enrichment for non-performance pillars ---
-    if code != "performance":
-        extra_aliases: List[str] = []
-        if code == "reliability":
-            if "single point of failure" in corpus_lower:
-                extra_aliases.append("redundancy")
-            if "traffic manager" in corpus_lower or "front door" in corpus_lower:
-                extra_aliases.append("failover")
-            if "site recovery" in corpus_lower:
-                extra_aliases.append("disaster recovery")
-            if "availability zone" in corpus_lower or "zone-redundant" in corpus_lower:
-                extra_aliases.append("availability")
-            if "self-healing" in corpus_lower or "auto-repair" in corpus_lower:
-                extra_aliases.append("resiliency")
-            if "health probe" in corpus_lower:
-                extra_aliases.append("health check")
-            if "sla" in corpus_lower and "uptime" in corpus_lower:
-                extra_aliases.append("availability")
-            # Extended reliability aliases
-            if any(x in corpus_lower for x in ["rto", "recovery time objective"]):
-                extra_aliases.append("disaster recovery")
-            if any(x in corpus_lower for x in ["rpo", "recovery point objective"]):
-                extra_aliases.append("backup")
-            if any(x in corpus_lower for x in ["active-active", "active-passive", "standby"]):
-                extra_aliases.append("failover")
-            if any(x in corpus_lower for x in ["partition tolerance", "split-brain", "quorum"]):
-                extra_aliases.append("resiliency")
-            if any(x in corpus_lower for x in ["chaos monkey", "fault injection", "failure testing"]):
-                extra_aliases.append("chaos engineering")
-        elif code == "security":
-            if "private endpoint" in corpus_lower:
-                extra_aliases.append("network security")
-            if "defender for cloud" in corpus_lower or "microsoft defender" in corpus_lower:
-                extra_aliases.append("threat detection")
-            if "sentinel" in corpus_lower or "siem" in corpus_lower:
-                extra_aliases.append("threat detection")
-            if "pim" in corpus_lower or "privileged identity" in corpus_lower:
-                extra_aliases.append("authorization")
-            if "mfa" in corpus_lower or "multi-factor authentication" in corpus_lower:
-                extra_aliases.append("authentication")
-            if "conditional access" in corpus_lower or "least privilege" in corpus_lower:
-                extra_aliases.append("authorization")
-            # Extended security aliases
-            if any(x in corpus_lower for x in ["penetration test", "pen test", "vulnerability scan"]):
-                extra_aliases.append("threat detection")
-            if any(x in corpus_lower for x in ["waf", "web application firewall", "ddos protection"]):
-                extra_aliases.append("firewall")
-            if any(x in corpus_lower for x in ["security baseline", "cis benchmark", "hardening"]):
-                extra_aliases.append("compliance")
-            if any(x in corpus_lower for x in ["secrets rotation", "credential rotation"]):
-                extra_aliases.append("key vault")
-            if any(x in corpus_lower for x in ["tls", "ssl", "https", "encryption in transit"]):
-                extra_aliases.append("encryption")
-        elif code == "operational":
-            if "infrastructure as code" in corpus_lower or "bicep" in corpus_lower or "terraform" in corpus_lower:
-                extra_aliases.append("deployment")
-            if "runbook" in corpus_lower:
-                extra_aliases.append("automation")
-            if "observability" in corpus_lower:
-                extra_aliases.append("monitoring")
-            if "blue-green" in corpus_lower or "canary" in corpus_lower:
-                extra_aliases.append("deployment")
-            # Extended operational aliases
-            if any(x in corpus_lower for x in ["runbook automation", "automated remediation", "self-service"]):
-                extra_aliases.append("automation")
-            if any(x in corpus_lower for x in ["change management", "change control", "change approval"]):
-                extra_aliases.append("deployment")
-            if any(x in corpus_lower for x in ["incident management", "on-call", "pagerduty"]):
-                extra_aliases.append("alerting")
-            if any(x in corpus_lower for x in ["sre", "site reliability", "error budget"]):
-                extra_aliases.append("monitoring")
-            if any(x in corpus_lower for x in ["distributed tracing", "correlation id", "trace context"]):
-                extra_aliases.append("observability")
-        elif code == "cost":
-            if "reserved instance" in corpus_lower or "savings plan" in corpus_lower:
-                extra_aliases.append("reserved instance")
-            if "rightsizing" in corpus_lower or "right-sizing" in corpus_lower:
-                extra_aliases.append("optimization")
-            if "lifecycle policy" in corpus_lower:
-                extra_aliases.append("optimization")
-            if "finops" in corpus_lower:
-                extra_aliases.append("cost")
-            # Extended cost aliases
-            if any(x in corpus_lower for x in ["cost anomaly", "anomaly detection", "spend anomaly"]):
-                extra_aliases.append("monitoring")
-            if any(x in corpus_lower for x in ["chargeback", "showback", "cost allocation"]):
-                extra_aliases.append("tagging")
-            if any(x in corpus_lower for x in ["spot instance", "spot vm", "low-priority"]):
-                extra_aliases.append("spot instance")
-            if any(x in corpus_lower for x in ["commitment", "azure hybrid benefit", "ahb"]):
-                extra_aliases.append("reserved instance")
-            if any(x in corpus_lower for x in ["waste", "orphaned resource", "idle resource"]):
-                extra_aliases.append("optimization")
-        if extra_aliases:
-            corpus_lower += " " + " ".join(sorted(set(extra_aliases)))
-            print(f"[semantic-alias] {code}: added aliases {sorted(set(extra_aliases))}")
-    
-    # Check for negative indicators (things mentioned as missing/not configured)
-    # Detect actual implementation gaps (context-aware)
-    # Distinguish between "no backup" (BAD) and "no public exposure" (GOOD)
-    # Detect ACTUAL implementation gaps (things that are broken/missing)
-    # These are BAD and should be penalized
-    actual_gap_patterns = [
-        "not configured", "not enabled", "not implemented", "disabled", "manual only",
-        "not yet", "doesn't have", "lacks", "anti-pattern", "known issue",
-        "technical debt", "backup not configured", "backup missing",
-        "disaster recovery not configured", "dr not configured",
-        "redundancy not configured", "failover not configured",
-        "encryption not enabled", "encryption disabled",
-        "monitoring not configured", "logging not enabled",
-        "mfa not configured", "rbac not implemented"
-    ]
-    
-    # Positive negations - these are GOOD security/reliability practices
-    # Should NOT be penalized (e.g., "no public internet" is GOOD)
-    positive_negations = [
-        "no public", "no internet", "no external access", "no direct access",
-        "no single point", "no hardcoded", "no plaintext", "no unencrypted",
-        "no manual", "no downtime", "zero downtime", "no data loss"
-    ]
-    
-    # First, remove positive negations from corpus for gap counting
-    corpus_for_gap_check = corpus_lower
-    for pos_neg in positive_negations:
-        corpus_for_gap_check = corpus_for_gap_check.replace(pos_neg, "")
-    
-    # Now count actual gaps in the cleaned corpus
-    negative_mentions = sum(corpus_for_gap_check.count(pattern) for pattern in actual_gap_patterns)
-    
-    # Define pillar-specific concepts with weights (critical vs. important)
-    concepts = {
-        "reliability": {
-            "critical": ["redundancy", "failover", "backup", "disaster recovery", "availability"],
-            "important": ["replica", "multi-region", "health check", "monitoring", "sla"],
-            "nice_to_have": ["resiliency", "chaos engineering", "circuit breaker"]
-        },
-        "security": {
-            "critical": ["encryption", "authentication", "authorization", "key vault"],
-            "important": ["rbac", "network security", "firewall", "identity", "secret"],
-            "nice_to_have": ["zero trust", "threat detection", "compliance", "audit"]
-        },
-        "cost": {
-            "critical": ["cost", "pricing", "budget"],
-            "important": ["optimization", "reserved instance", "tagging", "monitoring"],
-            "nice_to_have": ["autoscaling", "rightsizing", "spot instance"]
-        },
-        "operational": {
-            "critical": ["monitoring", "logging", "deployment"],
-            "important": ["ci/cd", "pipeline", "automation", "alerting"],
-            "nice_to_have": ["infrastructure as code", "gitops", "observability"]
-        },
-        "performance": {
-            "critical": ["latency", "throughput", "scalability"],
-            "important": ["cache", "cdn", "load balancing", "indexing"],
-            "nice_to_have": ["compression", "optimization", "query tuning"]
-        }
-    }
+    aliases = _semantic_aliases(corpus_lower, code)
+    if aliases:
+        # Append aliases to corpus_lower so downstream simple 'in' checks pick them up
+        corpus_lower += " " + " ".join(aliases)
+        print(f"[semantic-alias] {code}: added aliases {aliases}")
 
-    # Advanced practice patterns (gates for >80 / >90 bands)
-    advanced_patterns = {
-        "reliability": ["rto", "rpo", "chaos", "fault injection", "circuit breaker", "active-active", "quorum"],
-        "security": ["threat modeling", "penetration test", "key rotation", "purple team", "conditional access", "managed identity", "waf", "ddos"],
-        "cost": ["anomaly detection", "chargeback", "showback", "finops", "reserved instance", "rightsizing", "spot", "commitment"],
-        "operational": ["runbook", "auto-remediation", "error budget", "postmortem", "canary", "blue-green", "slo", "on-call"],
-        "performance": ["p95", "p99", "benchmark", "capacity planning", "profiling", "load test", "stress test", "query optimization"]
-    }
+    # Check for negative indicators (things mentioned as missing/not configured)
+    # Distinguish between "no backup" (BAD) and "no public exposure" (GOOD);
+    # see ACTUAL_GAP_PATTERNS / POSITIVE_NEGATIONS
+    negative_mentions = _count_gap_mentions(corpus_lower)
     
-    pillar_concepts = concepts.get(code, {"critical": [], "important": [], "nice_to_have": []})
+    pillar_concepts = PILLAR_CONCEPTS.get(code, {"critical": [], "important": [], "nice_to_have": []})
+    hits = _keyword_hits(corpus_lower, code)
     
     # Calculate concept coverage
-    critical_found_list = [c for c in pillar_concepts["critical"] if c in corpus_lower]
+    critical_found_list = [c for c in pillar_concepts["critical"] if c in hits]
     critical_found = len(critical_found_list)
     critical_total = len(pillar_concepts["critical"])
-    important_found_list = [c for c in pillar_concepts["important"] if c in corpus_lower]
+    important_found_list = [c for c in pillar_concepts["important"] if c in hits]
     important_found = len(important_found_list)
     important_total = len(pillar_concepts["important"])
-    nice_found_list = [c for c in pillar_concepts["nice_to_have"] if c in corpus_lower]
+    nice_found_list = [c for c in pillar_concepts["nice_to_have"] if c in hits]
     nice_found = len(nice_found_list)
     nice_total = len(pillar_concepts["nice_to_have"])
     
@@ -1515,15 +1624,12 @@ def _calculate_conservative_score(corpus: str, code: str, name: str) -> tuple[in
         density_multiplier = 1.0
 
     # Depth / specificity assessment
-    import re as _re_depth
     # Simple sentence segmentation: split on period/question/exclamation
-    sentences = [s.strip() for s in _re_depth.split(r'[.!?]', corpus) if isinstance(s, str) and s.strip()]
+    sentences = [s.strip() for s in _SENTENCE_SPLIT_RE.split(corpus) if isinstance(s, str) and s.strip()]
     avg_sentence_len = sum(len(s) for s in sentences) / max(1, len(sentences))
-    implementation_verbs = ["deploy", "automate", "monitor", "test", "enforce", "rotate", "scan", "instrument", "benchmark", "backup", "restore", "replicate", "harden", "patch"]
-    impl_hits = sum(1 for v in implementation_verbs if v in corpus_lower)
-    metric_regex = _re_depth.compile(r"\b\d+(?:\.\d+)?\s*(?:ms|s|sec|seconds|minutes|hours|days|%|gb|tb|mbps|rps|tps|qps|sla|cost|usd|\$)\b")
-    metric_pairs = len(set(metric_regex.findall(corpus_lower)))
-    advanced_hits = sum(1 for p in advanced_patterns.get(code, []) if p in corpus_lower)
+    impl_hits = sum(1 for v in IMPLEMENTATION_VERBS if v in hits)
+    metric_pairs = len(set(_METRIC_PAIR_RE.findall(corpus_lower)))
+    advanced_hits = sum(1 for p in ADVANCED_PATTERNS.get(code, []) if p in hits)
 
     depth_factor = 0.6
     if avg_sentence_len > 60:  # longer, descriptive sentences
@@ -1635,17 +1741,7 @@ def _calculate_conservative_score(corpus: str, code: str, name: str) -> tuple[in
                 breakdown["steps"].append({"step": "reliability_excellence", "before": before, "after": adjusted_score, "reason": "Reliability excellence boost"})
     
     # Additional penalty for specific anti-patterns and critical gaps
-    # Critical implementation gaps (avoid false positives from well-architected descriptions)
-    critical_gaps = [
-        "backup not configured", "no backup policy", "backup missing",
-        "disaster recovery not configured", "dr not configured",
-        "redundancy not configured", "failover not configured",
-        "encryption not enabled", "encryption disabled",
-        "monitoring not configured", "logging not enabled",
-        "single region only", "not multi-region",
-        "missing critical"
-    ]
-    critical_gap_count = sum(corpus_lower.count(gap) for gap in critical_gaps)
+    critical_gap_count = _count_critical_gaps(corpus_lower)
     if critical_gap_count > 3:
         critical_penalty = min(0.25, critical_gap_count / 25)  # slightly softened
         before = adjusted_score
@@ -1842,7 +1938,7 @@ async def _evaluate_pillar(aid: str, code: str, name: str) -> PillarResult:
         AgentCls = agent_cls_map[code]
         agent = AgentCls()
         await _update_pillar_progress(aid, name, 30)
-        # Real agents may raise SystemExit if framework missing; catch and fallback
+        # Real agents raise AgentFrameworkUnavailableError if the framework is missing; caught below
         if code == "reliability":
             assessment = await agent.assess_architecture_reliability(corpus)
         else:
@@ -2404,9 +2500,8 @@ Produce 2 concise sentences using at least one quantitative indicator (e.g., % r
         }
         # --- Build subcategory details for transparent concept coverage ---
         # Helper: attribute concepts uniquely to best matching subcategory by token overlap
-        import re as _re_attr
         def _tokenize(t: str) -> set:
-            return set(_re_attr.findall(r"[A-Za-z]+", t.lower()))
+            return set(_WORD_RE.findall(t.lower()))
         all_subcat_tokens = {sc: _tokenize(sc) for sc in (final_subcats or {})}
         # Gather flattened concept lists
         raw_sum = sum(final_subcats.values()) if final_subcats else 0
@@ -2453,9 +2548,8 @@ Produce 2 concise sentences using at least one quantitative indicator (e.g., % r
             if curated_loaded:
                 curated_expected_map = curated_loaded
         # Helper: fuzzy map subcategory names to curated keys by token overlap
-        import re as _re_cur
         def _tok_cur(s: str) -> set:
-            return set(_re_cur.findall(r"[A-Za-z]+", s.lower()))
+            return set(_WORD_RE.findall(s.lower()))
         curated_tokens = {k: _tok_cur(k) for k in curated_expected_map}
         def _best_curated(subcat_name: str) -> Optional[List[str]]:
             if subcat_name in curated_expected_map:
@@ -2539,9 +2633,8 @@ Produce 2 concise sentences using at least one quantitative indicator (e.g., % r
             return all_concepts[:8] if all_concepts else ['best practices', 'documentation', 'standards']
 
         # Helper to attribute concepts to subcategories via token overlap
-        import re as _re_tokens
         def _tokens(s: str) -> set:
-            return set(_re_tokens.findall(r"[A-Za-z]+", s.lower()))
+            return set(_WORD_RE.findall(s.lower()))
 
         subcat_details: Dict[str, SubcategoryDetail] = {}
         all_found = concept_found_list
@@ -3144,24 +3237,30 @@ async def rescore_assessment(aid: str):
     if not rebuilt_corpus.strip():
         raise HTTPException(400, "unified corpus empty; cannot rescore")
 
-    # Prepare snapshot history
-    snapshot = {
+    # Prepare snapshot history (one pass over the current results fills both maps)
+    pillar_scores: Dict[str, int] = {}
+    score_sources: Dict[str, str] = {}
+    for r in assessment.pillar_results:
+        pillar_scores[r.pillar] = r.overall_score
+        score_sources[r.pillar] = r.score_source
+    assessment.score_history.append({
         "timestamp": dt.datetime.utcnow().isoformat(),
         "overall_architecture_score": assessment.overall_architecture_score,
-        "pillar_scores": {r.pillar: r.overall_score for r in assessment.pillar_results},
-        "score_source": {r.pillar: r.score_source for r in assessment.pillar_results},
-    }
-    assessment.score_history.append(snapshot)
+        "pillar_scores": pillar_scores,
+        "score_source": score_sources,
+    })
 
     # Map existing results for recommendations reuse
     existing_by_name = {r.pillar: r for r in assessment.pillar_results}
     new_pillar_results: List[PillarResult] = []
 
-    # Recompute scores for each pillar synchronously (no agent LLM calls)
+    # Recompute scores for each pillar synchronously (no agent LLM calls); every pillar
+    # scans the same corpus, so case-fold it once up front
+    rebuilt_corpus_lower = rebuilt_corpus.lower()
     for code, name in PILLARS:
         existing = existing_by_name.get(name)
         try:
-            new_score, confidence, _ignored_subcats, score_source, coverage_pct, negative_mentions, breakdown = _calculate_conservative_score(rebuilt_corpus, code, name)
+            new_score, confidence, _ignored_subcats, score_source, coverage_pct, negative_mentions, breakdown = _calculate_conservative_score(rebuilt_corpus, code, name, rebuilt_corpus_lower)
         except Exception as e:
             print(f"[rescore] [ERROR] scoring failed for {name}: {e}")
             # Preserve existing result on failure
@@ -3216,9 +3315,8 @@ async def rescore_assessment(aid: str):
         if normalization_applied and raw_sum > 0:
             norm_factor = new_score / raw_sum
         concepts_section = (breakdown or {}).get("concepts", {})
-        import re as _re_tokens2
         def _tokens2(s: str) -> set:
-            return set(_re_tokens2.findall(r"[A-Za-z]+", s.lower()))
+            return set(_WORD_RE.findall(s.lower()))
         concept_found: List[str] = []
         concept_missing: List[str] = []
         # Flatten concept lists if structured by tiers
@@ -3229,7 +3327,7 @@ async def rescore_assessment(aid: str):
         subcat_details: Dict[str, SubcategoryDetail] = {}
         # Refined attribution & penalties (mirror evaluate logic)
         def _tokenize2(t: str) -> set:
-            return set(_re_tokens2.findall(r"[A-Za-z]+", t.lower()))
+            return set(_WORD_RE.findall(t.lower()))
         sub_tokens = {sc: _tokenize2(sc) for sc in scaled_subcats}
         def _attr2(concepts: List[str]) -> Dict[str, List[str]]:
             assigned = {sc: [] for sc in sub_tokens}
@@ -3256,9 +3354,8 @@ async def rescore_assessment(aid: str):
             curated_loaded2 = load_expected_concepts(name)
             if curated_loaded2:
                 curated_expected_map2 = curated_loaded2
-        import re as _re_cur2
         def _tok_cur2(s: str) -> set:
-            return set(_re_cur2.findall(r"[A-Za-z]+", s.lower()))
+            return set(_WORD_RE.findall(s.lower()))
         curated_tokens2 = {k: _tok_cur2(k) for k in curated_expected_map2}
         def _best_curated2(subcat_name: str) -> Optional[List[str]]:
             if subcat_name in curated_expected_map2:
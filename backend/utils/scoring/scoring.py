@@ -1,18 +1,26 @@
 # Migrated scoring module from src.utils.scoring.scoring
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import json, re
+try:  # google-re2: linear-time matching for the JSON-defined signal/gap patterns
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
 BASE_DIR = Path(__file__).parent
 class PillarNotFoundError(FileNotFoundError):
     pass
-@dataclass
+# slots: one PracticeScore per practice per pillar per scoring run; no per-instance __dict__
+@dataclass(slots=True)
 class PracticeScore:
     code: str; title: str; weight: float; score: int; matched_signals: List[str]; total_signals: int; coverage: float; mode: str
     def to_dict(self) -> Dict[str, Any]:
         return {"code": self.code, "title": self.title, "weight": self.weight, "score": self.score, "matched_signals": self.matched_signals, "total_signals": self.total_signals, "coverage": round(self.coverage,3), "mode": self.mode}
-@dataclass
+@dataclass(slots=True)
 class PillarScores:
     pillar: str; version: str; overall_maturity_percent: float; scale: Dict[str,str]; practice_scores: List[PracticeScore]; recommendations: List[Dict[str,Any]]; gap_results: List[Dict[str,Any]]; framework: Optional[str]=None
     def to_dict(self) -> Dict[str, Any]:
@@ -27,10 +35,29 @@ def load_pillar(pillar: str) -> Dict[str, Any]:
     if not file_path.exists(): raise PillarNotFoundError(f"Pillar definition not found: {file_path}")
     with file_path.open('r', encoding='utf-8') as f: return json.load(f)
 
+class _AsciiRe2Pattern:
+    """re2 for ASCII text, re otherwise: re2's word boundaries are ASCII-only, so 'backup' would match inside 'backupé'."""
+    __slots__=("fast","full")
+    def __init__(self, fast, full): self.fast=fast; self.full=full
+    def search(self, text: str): return (self.fast if text.isascii() else self.full).search(text)
+
+def _compile_pattern(pattern: str, ignorecase: bool=False):
+    """Compile with re2 when installed; fall back to re (also for syntax re2 rejects, e.g. lookarounds)."""
+    full=re.compile(pattern, re.IGNORECASE if ignorecase else 0)
+    if RE2_AVAILABLE:
+        opts=re2.Options(); opts.log_errors=False; opts.case_sensitive=not ignorecase  # rejected patterns stay off stderr
+        try: return _AsciiRe2Pattern(re2.compile(pattern, opts), full)
+        except re2.error: pass
+    return full
+
+@lru_cache(maxsize=4096)
+def _phrase_regex(phrase: str):
+    return _compile_pattern(r"\b" + re.escape(phrase) + r"\b")
+
 def _phrase_present(text: str, phrase: str) -> bool:
     phrase=phrase.strip()
     if not phrase: return False
-    return re.search(r"\b" + re.escape(phrase) + r"\b", text) is not None
+    return _phrase_regex(phrase).search(text) is not None
 
 def _match_scoring_signals(text: str, scoring_conf: Dict[str, Any]) -> Dict[str, Any]:
     signals: List[str] = scoring_conf.get("signals", [])
@@ -43,12 +70,13 @@ def _match_scoring_signals(text: str, scoring_conf: Dict[str, Any]) -> Dict[str,
     coverage = matched_weight/total_weight if total_weight else 0.0
     return {"matched": matched, "matched_weight": matched_weight, "total_weight": total_weight, "coverage": coverage}
 
+_TIERED_THRESHOLDS = ((1.0,5),(0.75,4),(0.5,3),(0.25,2),(0.0,1))
+
 def _score_from_coverage(mode: str, coverage: float, any_matched: bool, full_match: bool) -> int:
     if not any_matched: return 0
     if mode == 'proportional': return int(round(coverage*5))
     if mode == 'tiered':
-        thresholds=[(1.0,5),(0.75,4),(0.5,3),(0.25,2),(0.0,1)]
-        for t,sc in thresholds:
+        for t,sc in _TIERED_THRESHOLDS:
             if coverage>=t-1e-9 and (t<1.0 or full_match): return sc
         return 1
     if mode == 'binary': return 5 if full_match else (4 if coverage>=0.5 else 2)
@@ -66,31 +94,39 @@ def _score_practice(practice: Dict[str,Any], text: str, override_weight: Optiona
     return PracticeScore(code=practice.get('code'), title=practice.get('title',''), weight=float(override_weight if override_weight is not None else practice.get('weight',0)), score=score, matched_signals=matched, total_signals=total_signals, coverage=coverage, mode=mode)
 
 def _collect_recommendations(practice: Dict[str,Any], ps: PracticeScore) -> List[Dict[str,Any]]:
+    # Only weak practices (score<=2) surface recommendations; skip severity parsing for the rest
+    if ps.score>2: return []
     recs=[]
     for rec in practice.get('recommendations',[]):
         severity_raw = rec.get('severity') or rec.get('execution_priority') or rec.get('priority') or 5
         try: severity=int(severity_raw)
         except (TypeError,ValueError): severity=5
-        if ps.score<=2 and severity<=2:
+        if severity<=2:
             norm={k:v for k,v in rec.items() if k not in ('priority','execution_priority')}; norm['severity']=severity; norm['practice']=ps.code; recs.append(norm)
     return recs
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_REGEX_META_RE = re.compile(r"[\(\)\|\[\]\?\+\*]")
+
+@lru_cache(maxsize=1024)
+def _gap_regex(raw: str):
+    """Compile a gap pattern once: raw regexes as-is, plain phrases as whitespace-tolerant word matches."""
+    raw_norm=_WHITESPACE_RE.sub(" ", raw.strip().lower())
+    if _REGEX_META_RE.search(raw_norm): pattern_str=raw_norm
+    else:
+        tokens=raw_norm.split()
+        if not tokens: return None
+        pattern_str=r"\b" + r"\s+".join(re.escape(t) for t in tokens) + r"\b"
+    try: return _compile_pattern(pattern_str, ignorecase=True)
+    except re.error: return None
+
 def _evaluate_gaps(text: str, gaps_def: List[Dict[str,Any]]) -> List[Dict[str,Any]]:
-    import re as _re
-    norm_text=_re.sub(r"\s+"," ", text.lower()); results=[]
+    norm_text=_WHITESPACE_RE.sub(" ", text.lower()); results=[]
     for gap in gaps_def:
-        raw_patterns: List[str] = gap.get('patterns',[]); matched_patterns=[]; compiled=[]
+        raw_patterns: List[str] = gap.get('patterns',[]); matched_patterns=[]
         for raw in raw_patterns:
-            raw_norm=_re.sub(r"\s+"," ", raw.strip().lower())
-            if _re.search(r"[\(\)\|\[\]\?\+\*]", raw_norm): pattern_str=raw_norm
-            else:
-                tokens=raw_norm.split();
-                if not tokens: continue
-                escaped=[_re.escape(t) for t in tokens]; pattern_str=fr"\b{'\\s+'.join(escaped)}\b"
-            try: compiled.append((raw,_re.compile(pattern_str,_re.IGNORECASE)))
-            except _re.error: continue
-        for original, regex in compiled:
-            if regex.search(norm_text): matched_patterns.append(original)
+            regex=_gap_regex(raw)
+            if regex is not None and regex.search(norm_text): matched_patterns.append(raw)
         results.append({"id": gap.get('id'), "label": gap.get('label'), "detail": gap.get('detail'), "practice": gap.get('practice'), "matched": bool(matched_patterns), "matchedPatterns": matched_patterns, "recommendationHintKeywords": gap.get('recommendation_hint_keywords', [])})
     return results
 
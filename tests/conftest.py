@@ -3,14 +3,146 @@
 This avoids needing editable installs during local development. If a proper
 package structure (e.g., pyproject.toml with packages) is later added, this
 shim can be removed.
+
+Also provides a session-scoped ``client`` fixture so FastAPI app startup runs
+once for the whole test session (and once per worker under pytest-xdist), and
+an ``async_client`` fixture that drives the same app in-process over
+``httpx.ASGITransport`` for ``async`` tests.
+
+``json_body`` decodes a response body with orjson when it is installed.
+
+``fake_agent_factory`` wires a pillar agent to canned LLM/MCP output so the
+agent e2e tests share one copy of the faking boilerplate.
+
+When ``uvloop`` is installed it is used as the session-wide event loop policy
+so async tests share the faster loop implementation; otherwise the default
+asyncio policy is kept.
 """
 
 from __future__ import annotations
 
+import asyncio
 import sys
 from pathlib import Path
 
+import pytest
+
+try:  # Optional dependency (not available on Windows)
+    import uvloop  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    uvloop = None  # type: ignore
+
+try:  # Optional fast JSON decoding for large API responses
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore
+
 ROOT = Path(__file__).resolve().parent.parent
 SRC = ROOT / "src"
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+
+def pytest_configure(config):  # noqa: ARG001 - pytest hook signature
+    if uvloop is not None:
+        policy = uvloop.EventLoopPolicy()
+        asyncio.set_event_loop_policy(policy)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Shared FastAPI TestClient; lifespan startup/shutdown runs exactly once."""
+    from fastapi.testclient import TestClient
+    import backend.server as server
+
+    # Keep the suite on the in-memory ASSESSMENTS store even if motor is installed locally.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(server, "AsyncIOMotorClient", None)
+        with TestClient(server.app) as c:
+            yield c
+
+
+@pytest.fixture
+async def async_client(client):
+    """httpx.AsyncClient bound to the app via ASGI (no thread/portal hop per request).
+
+    Depends on ``client`` so the app's startup hook has already run.
+    """
+    import httpx
+    import backend.server as server
+
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def json_body():
+    """Return ``decode(resp)``: orjson over the raw body when available, else ``resp.json()``."""
+    if orjson is None:
+        return lambda resp: resp.json()
+    return lambda resp: orjson.loads(resp.content)
+
+
+class _CannedLLMAgent:
+    """Stand-in for the agent-framework chat agent: ``run`` returns fixed text."""
+
+    def __init__(self, response_text: str):
+        self.response_text = response_text
+
+    async def run(self, task, **kw):  # noqa: ARG002
+        await asyncio.sleep(0)
+        return self.response_text
+
+
+@pytest.fixture
+def fake_agent_factory(monkeypatch):
+    """Return ``make(module, class_name, response_text, mcp_docs=())`` -> patched agent class.
+
+    The agent module is imported lazily (skipped if unavailable), the framework
+    availability gate is lifted, ``_initialize_agent`` installs a canned LLM agent,
+    and MCP documentation search returns ``mcp_docs``.
+    """
+    pillar_agent_base = pytest.importorskip("backend.app.agents.pillar_agent_base")
+    monkeypatch.setattr(pillar_agent_base, "AGENT_FRAMEWORK_AVAILABLE", True)
+
+    def _make(module: str, class_name: str, response_text: str, mcp_docs=()):
+        agent_cls = getattr(pytest.importorskip(module), class_name)
+        llm_agent = _CannedLLMAgent(response_text)
+
+        async def _fake_init(self):
+            await asyncio.sleep(0)
+            self.agent = llm_agent
+
+        async def _fake_mcp(service: str, topic: str):  # noqa: ARG001
+            await asyncio.sleep(0)
+            return list(mcp_docs)
+
+        monkeypatch.setattr(agent_cls, "_initialize_agent", _fake_init, raising=True)
+        monkeypatch.setattr(
+            "backend.app.tools.mcp_tools.MCPDocumentationClient.search_docs",
+            _fake_mcp,
+            raising=False,
+        )
+        return agent_cls
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def operational_architecture() -> str:
+    """Operational Excellence sample architecture, read from disk once per session."""
+    return (FIXTURES_DIR / "operational_sample_architecture.txt").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def security_architecture() -> str:
+    """Security sample architecture, read from disk once per session."""
+    return (FIXTURES_DIR / "security_sample_architecture.txt").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def cost_architecture() -> str:
+    """Cost Optimization sample architecture, read from disk once per session."""
+    return (FIXTURES_DIR / "cost_sample_architecture.txt").read_text(encoding="utf-8")
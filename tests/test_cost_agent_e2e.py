@@ -1,16 +1,13 @@
 """End-to-end test for Cost Optimization agent."""
 
-import asyncio
 import json
-from pathlib import Path
 
 import pytest
 
-from backend.app.agents.cost_agent import CostAgent
-
 
 @pytest.mark.asyncio
-async def test_cost_agent_normalizes_recommendations(monkeypatch):
+@pytest.mark.slow
+async def test_cost_agent_normalizes_recommendations(fake_agent_factory, cost_architecture):
     """Test CostAgent assessment with mocked agent framework."""
     fake_json = {
         "pillar": "cost",
@@ -56,19 +53,11 @@ async def test_cost_agent_normalizes_recommendations(monkeypatch):
         ],
     }
 
-    async def _fake_init(self):  # type: ignore[override]
-        async def _fake_run(self_inner, task, **kw):  # noqa: ARG001
-            await asyncio.sleep(0)
-            return json.dumps(fake_json)
-        
-        await asyncio.sleep(0)
-        self.agent = type("Agent", (), {"run": _fake_run})()
-
-    monkeypatch.setattr(CostAgent, "_initialize_agent", _fake_init, raising=True)
-
-    async def _fake_mcp(service: str, topic: str):  # noqa: ARG001
-        await asyncio.sleep(0)
-        return [
+    CostAgent = fake_agent_factory(
+        "backend.app.agents.cost_agent",
+        "CostAgent",
+        json.dumps(fake_json),
+        mcp_docs=[
             {
                 "title": "Design review checklist for Cost Optimization",
                 "url": "https://learn.microsoft.com/azure/well-architected/cost/checklist",
@@ -77,21 +66,12 @@ async def test_cost_agent_normalizes_recommendations(monkeypatch):
                 "title": "Cost optimization design principles",
                 "url": "https://learn.microsoft.com/azure/well-architected/cost/principles",
             },
-        ]
-
-    monkeypatch.setattr(
-        "backend.app.tools.mcp_tools.MCPDocumentationClient.search_docs",
-        _fake_mcp,
-        raising=False,
+        ],
     )
 
-    # Read test architecture
-    fixture_path = Path(__file__).parent / "fixtures" / "cost_sample_architecture.txt"
-    architecture = fixture_path.read_text(encoding="utf-8")
-
     # Create agent and assess
     agent = CostAgent()
-    assessment = await agent.assess_architecture(architecture)
+    assessment = await agent.assess_architecture(cost_architecture)
     
     # Verify assessment structure (maturity comes from scoring engine, not LLM)
     assert "overall_maturity_percent" in assessment.maturity
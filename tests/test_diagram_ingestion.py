@@ -4,19 +4,15 @@ Validates that uploading a diagram results in extracted text or summary fields
 being populated and that the unified corpus contains diagram-derived text after
 analysis lifecycle.
 """
-from fastapi.testclient import TestClient
-from backend.server import app
 import io
 
-client = TestClient(app)
-
 SVG_SAMPLE = """<svg xmlns='http://www.w3.org/2000/svg' width='200' height='100'>
   <text x='10' y='20'>WebTier</text>
   <text x='10' y='40'>AppService</text>
   <text x='10' y='60'>AzureSQL</text>
 </svg>"""
 
-def test_diagram_upload_and_enrichment():
+def test_diagram_upload_and_enrichment(client):
     # Create assessment
     r = client.post('/api/assessments', json={'name': 'diagram-assessment'})
     assert r.status_code == 200, r.text
@@ -57,7 +53,3 @@ def test_diagram_upload_and_enrichment():
         assert diag_docs, 'Diagram document missing in assessment payload'
         enriched_tokens = ' '.join([str(d.get('raw_extracted_text','') or '') for d in diag_docs])
         assert any(t in enriched_tokens for t in ['WebTier','AppService','AzureSQL']), 'Extracted diagram tokens not found in corpus or enrichment fields'
-
-if __name__ == '__main__':  # pragma: no cover
-    test_diagram_upload_and_enrichment()
-    print('✅ Diagram ingestion test passed')
@@ -3,11 +3,33 @@ Tests for LLM provider embedding cache and resilience features
 """
 import pytest
 import asyncio
+import sys
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from backend.app.services.llm_provider import LLMProvider
 from backend.app.config.azure_openai import AzureOpenAISettings
 
 
+async def _fan_out(make_coro, count, capture_errors=False):
+    """Run ``count`` coroutines concurrently and return results in launch order.
+
+    Uses ``asyncio.TaskGroup`` on Python 3.11+ (falls back to ``asyncio.gather``
+    on 3.10). With ``capture_errors`` each coroutine is wrapped so a failure is
+    returned as its exception instead of cancelling its siblings.
+    """
+    async def _shielded():
+        try:
+            return await make_coro()
+        except Exception as e:  # noqa: BLE001 - sentinel for expected partial failures
+            return e
+
+    factory = _shielded if capture_errors else make_coro
+    if sys.version_info < (3, 11):
+        return await asyncio.gather(*[factory() for _ in range(count)])
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(factory()) for _ in range(count)]
+    return [t.result() for t in tasks]
+
+
 class TestEmbeddingCache:
     """Test in-memory SHA256 embedding cache"""
     
@@ -106,6 +128,65 @@ class TestEmbeddingCache:
         await provider.embed(["Test  sentence"])
         assert mock_client.embeddings.create.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_cache_partial_hits_preserve_order(self, mock_settings):
+        """Cached and freshly fetched vectors come back in input order"""
+        client = MagicMock()
+        
+        async def echo_create(model=None, input=None):
+            return {"data": [{"embedding": [float(len(t))]} for t in input]}
+        
+        client.embeddings.create = AsyncMock(side_effect=echo_create)
+        provider = LLMProvider(mock_settings, client)
+        
+        await provider.embed(["a"])
+        results = await provider.embed(["bbb", "a", "cc"])
+        
+        assert results == [[3.0], [1.0], [2.0]]
+        assert client.embeddings.create.call_args.kwargs["input"] == ["bbb", "cc"]
+    
+    @pytest.mark.asyncio
+    async def test_short_response_is_discarded_not_misaligned(self, mock_settings):
+        """A response missing one vector yields no embeddings rather than shifted ones"""
+        client = MagicMock()
+        
+        async def drop_middle_create(model=None, input=None):
+            data = [{"embedding": [float(len(t))]} for t in input]
+            del data[1]
+            return {"data": data}
+        
+        client.embeddings.create = AsyncMock(side_effect=drop_middle_create)
+        provider = LLMProvider(mock_settings, client)
+        
+        assert await provider.embed(["a", "bb", "ccc"]) == []
+        assert provider._embed_cache == {}
+    
+    @pytest.mark.asyncio
+    async def test_empty_vector_is_discarded_not_misaligned(self, mock_settings):
+        """An item with an empty embedding invalidates the batch but keeps good vectors cached"""
+        client = MagicMock()
+        
+        async def blank_middle_create(model=None, input=None):
+            return {"data": [{"embedding": [] if t == "bb" else [float(len(t))]} for t in input]}
+        
+        client.embeddings.create = AsyncMock(side_effect=blank_middle_create)
+        provider = LLMProvider(mock_settings, client)
+        
+        assert await provider.embed(["a", "bb", "ccc"]) == []
+        assert await provider.embed(["ccc", "a"]) == [[3.0], [1.0]]
+        assert client.embeddings.create.call_count == 1
+    
+    def test_cache_key_small_text_shortcut(self, mock_settings):
+        """Short texts key the cache directly; long texts are hashed to bytes"""
+        provider = LLMProvider(mock_settings)
+        
+        assert provider._cache_key("Text A") == "Text A"
+        
+        long_text = "x" * 65
+        key = provider._cache_key(long_text)
+        assert isinstance(key, bytes)
+        assert key != provider._cache_key(long_text + " ")
+
 
 class TestRateLimiting:
     """Test token bucket rate limiting"""
@@ -151,11 +232,9 @@ class TestRateLimiting:
         # For this test, we verify call count is limited
         
         # Attempt rapid-fire requests
-        tasks = [provider.chat(messages) for _ in range(5)]
-        
         # Some should be delayed/rejected by token bucket
         # (exact behavior depends on _consume_token implementation)
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await _fan_out(lambda: provider.chat(messages), 5, capture_errors=True)
         
         # At least some requests should have been throttled
         # (This test is illustrative; actual behavior may vary)
@@ -201,11 +280,8 @@ class TestConcurrencyControl:
         
         messages = [{"role": "user", "content": "Test"}]
         
-        # Launch 5 requests concurrently
-        tasks = [provider.chat(messages) for _ in range(5)]
-        
-        # All should eventually complete
-        results = await asyncio.gather(*tasks)
+        # Launch 5 requests concurrently; all should eventually complete
+        results = await _fan_out(lambda: provider.chat(messages), 5)
         assert len(results) == 5
         
         # Verify semaphore behavior (implementation-specific)
@@ -397,3 +473,21 @@ class TestProviderModeSelection:
         # Should use quality deployment despite short prompt
         call_args = mock_client.chat.completions.create.call_args
         assert call_args.kwargs["model"] == "gpt-4o"
+
+    @pytest.mark.asyncio
+    async def test_deployment_names_are_interned(self, mock_client):
+        """Deployment names built at runtime are interned, so routing reuses one object"""
+        settings = AzureOpenAISettings(
+            endpoint="https://test.openai.azure.com",
+            api_key="test_key",
+            chat_fast_deployment="".join(["gpt-", "4o-mini"]),
+            chat_quality_deployment="".join(["gpt-", "4o"]),
+            fast_token_threshold=600,
+            llm_enabled=True
+        )
+        assert settings.chat_fast_deployment is sys.intern("gpt-4o-mini")
+        assert settings.chat_quality_deployment is sys.intern("gpt-4o")
+
+        provider = LLMProvider(settings, mock_client)
+        await provider.chat([{"role": "user", "content": "Hi"}], force_mode="quality")
+        assert mock_client.chat.completions.create.call_args.kwargs["model"] is sys.intern("gpt-4o")
@@ -141,6 +141,15 @@ async def test_tool_manager_fallback():
     )
 
 
+class _RunResult:
+    """Lightweight agent run result object exposing ``.text``."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+
 @pytest.mark.asyncio
 async def test_mock_hosted_path(monkeypatch=None):  # monkeypatch is a pytest fixture if available
     # Import module locally to patch symbols
@@ -161,13 +170,9 @@ async def test_mock_hosted_path(monkeypatch=None):  # monkeypatch is a pytest fi
                 f"Resiliency Patterns {learn_base3}/en-us/azure/architecture/framework/reliability/reliability-patterns"
             )
         async def run(self, prompt: str):  # async to match awaited usage in code
-            class R:  # lightweight result object
-                pass
-            r = R()
-            r.text = self._text
             # minimal await to satisfy async usage in linters
             await asyncio.sleep(0)
-            return r
+            return _RunResult(self._text)
 
     class DummyChatClient:
         def __init__(self, async_credential):  # no state needed for tests
@@ -1,71 +1,62 @@
 """End-to-end test for Operational Excellence agent."""
 
-import asyncio
 import json
-from pathlib import Path
 
 import pytest
 
-from backend.app.agents.operational_agent import OperationalAgent
 
-
-@pytest.mark.asyncio
-async def test_operational_agent_normalizes_recommendations(monkeypatch):
-    """Test OperationalAgent assessment with mocked agent framework."""
-    fake_json = {
-        "pillar": "operational",
-        "domain_scores": {
-            "OE01": {"score": 25, "title": "Define standard practices to develop and operate workload"},
-            "OE02": {"score": 20, "title": "Formalize operational tasks"},
-            "OE03": {"score": 30, "title": "Formalize software ideation and planning"},
-            "OE04": {"score": 15, "title": "Enhance software development and quality assurance"},
-            "OE05": {"score": 10, "title": "Use infrastructure as code"},
-            "OE06": {"score": 5, "title": "Build workload supply chain with pipelines"},
-            "OE07": {"score": 20, "title": "Design and implement monitoring system"},
-            "OE08": {"score": 15, "title": "Establish structured incident management"},
-            "OE09": {"score": 25, "title": "Automate repetitive tasks"},
-            "OE10": {"score": 10, "title": "Design and implement automation upfront"},
-            "OE11": {"score": 5, "title": "Define safe deployment practices"},
+FAKE_JSON = {
+    "pillar": "operational",
+    "domain_scores": {
+        "OE01": {"score": 25, "title": "Define standard practices to develop and operate workload"},
+        "OE02": {"score": 20, "title": "Formalize operational tasks"},
+        "OE03": {"score": 30, "title": "Formalize software ideation and planning"},
+        "OE04": {"score": 15, "title": "Enhance software development and quality assurance"},
+        "OE05": {"score": 10, "title": "Use infrastructure as code"},
+        "OE06": {"score": 5, "title": "Build workload supply chain with pipelines"},
+        "OE07": {"score": 20, "title": "Design and implement monitoring system"},
+        "OE08": {"score": 15, "title": "Establish structured incident management"},
+        "OE09": {"score": 25, "title": "Automate repetitive tasks"},
+        "OE10": {"score": 10, "title": "Design and implement automation upfront"},
+        "OE11": {"score": 5, "title": "Define safe deployment practices"},
+    },
+    "maturity_level": "Initial",
+    "recommendations": [
+        {
+            "title": "Implement CI/CD pipelines for automated deployments",
+            "description": "Manual portal deployments pose significant risk",
+            "priority": "Critical",
+            "impact_score": 10,
+            "pillar_codes": ["OE06"],
         },
-        "maturity_level": "Initial",
-        "recommendations": [
-            {
-                "title": "Implement CI/CD pipelines for automated deployments",
-                "description": "Manual portal deployments pose significant risk",
-                "priority": "Critical",
-                "impact_score": 10,
-                "pillar_codes": ["OE06"],
-            },
-            {
-                "title": "Adopt Infrastructure as Code with Bicep or Terraform",
-                "description": "No IaC practices, manual provisioning leads to drift",
-                "priority": "Critical",
-                "impact_score": 9,
-                "pillar_codes": ["OE05"],
-            },
-            {
-                "title": "Deploy Application Insights for observability",
-                "description": "Lack of comprehensive monitoring and telemetry",
-                "priority": "High",
-                "impact_score": 8,
-                "pillar_codes": ["OE07"],
-            },
-        ],
-    }
-
-    async def _fake_init(self):  # type: ignore[override]
-        async def _fake_run(self_inner, task, **kw):  # noqa: ARG001
-            await asyncio.sleep(0)
-            return json.dumps(fake_json)
-        
-        await asyncio.sleep(0)
-        self.agent = type("Agent", (), {"run": _fake_run})()
+        {
+            "title": "Adopt Infrastructure as Code with Bicep or Terraform",
+            "description": "No IaC practices, manual provisioning leads to drift",
+            "priority": "Critical",
+            "impact_score": 9,
+            "pillar_codes": ["OE05"],
+        },
+        {
+            "title": "Deploy Application Insights for observability",
+            "description": "Lack of comprehensive monitoring and telemetry",
+            "priority": "High",
+            "impact_score": 8,
+            "pillar_codes": ["OE07"],
+        },
+    ],
+}
+_FAKE_JSON_STR = json.dumps(FAKE_JSON)
 
-    monkeypatch.setattr(OperationalAgent, "_initialize_agent", _fake_init, raising=True)
 
-    async def _fake_mcp(service: str, topic: str):  # noqa: ARG001
-        await asyncio.sleep(0)
-        return [
+@pytest.mark.asyncio
+@pytest.mark.slow
+async def test_operational_agent_normalizes_recommendations(fake_agent_factory, operational_architecture):
+    """Test OperationalAgent assessment with mocked agent framework."""
+    OperationalAgent = fake_agent_factory(
+        "backend.app.agents.operational_agent",
+        "OperationalAgent",
+        _FAKE_JSON_STR,
+        mcp_docs=[
             {
                 "title": "Design review checklist for Operational Excellence",
                 "url": "https://learn.microsoft.com/azure/well-architected/operational-excellence/checklist",
@@ -74,21 +65,12 @@ async def test_operational_agent_normalizes_recommendations(monkeypatch):
                 "title": "DevOps culture",
                 "url": "https://learn.microsoft.com/azure/well-architected/operational-excellence/devops-culture",
             },
-        ]
-
-    monkeypatch.setattr(
-        "backend.app.tools.mcp_tools.MCPDocumentationClient.search_docs",
-        _fake_mcp,
-        raising=False,
+        ],
     )
 
-    # Read test architecture
-    fixture_path = Path(__file__).parent / "fixtures" / "operational_sample_architecture.txt"
-    architecture = fixture_path.read_text(encoding="utf-8")
-
     # Create agent and assess
     agent = OperationalAgent()
-    assessment = await agent.assess_architecture(architecture)
+    assessment = await agent.assess_architecture(operational_architecture)
 
     # Verify assessment structure
     assert "overall_maturity_percent" in assessment.maturity
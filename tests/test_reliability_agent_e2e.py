@@ -36,23 +36,30 @@ def _log_assert(desc: str, **ctx):
         print(f"     {k} = {v}")
 
 
+class _FakeResponse:
+    """Agent run result exposing ``.text``; defined once instead of per ``run`` call."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+
 class _FakeLLMAgent:
     """Minimal async fake implementing .run(prompt) -> object with .text."""
 
     def __init__(self, payload: Dict[str, Any]):
         self.payload = payload
+        self._payload_str = json.dumps(payload)
 
     async def run(self, prompt: str):
-        class R:
-            pass
-        r = R()
         # We ignore the prompt and just return the injected JSON payload
-        r.text = json.dumps(self.payload)
         await asyncio.sleep(0)
-        return r
+        return _FakeResponse(self._payload_str)
 
 
 @pytest.mark.asyncio
+@pytest.mark.slow
 async def test_reliability_agent_llm_mcp_integration(monkeypatch):
     # Lazy import to avoid failing at collection time if framework missing
     global ReliabilityAgent
@@ -62,6 +69,9 @@ async def test_reliability_agent_llm_mcp_integration(monkeypatch):
             ReliabilityAgent = _RA
         except Exception:
             pytest.skip("Agent framework not available; skipping e2e agent test")
+    # The LLM client and MCP lookups are faked below, so the real framework is not required
+    import app.agents.pillar_agent_base as _pillar_agent_base
+    monkeypatch.setattr(_pillar_agent_base, "AGENT_FRAMEWORK_AVAILABLE", True)
     name = "reliability_agent_llm_mcp_integration"
     _print_banner(f"TEST START: {name}")
     architecture = """
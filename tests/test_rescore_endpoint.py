@@ -1,9 +1,8 @@
-from fastapi.testclient import TestClient
 import datetime as dt
 
-from backend.server import app, ASSESSMENTS
+import pytest
 
-client = TestClient(app)
+from backend.server import ASSESSMENTS
 
 ARCH_DOC = """Highly available multi-region architecture.
 We implement redundancy, failover, backup, disaster recovery with defined RTO 30 minutes and RPO 15 minutes.
@@ -13,20 +12,21 @@ Operational excellence: monitoring, logging, automation runbook, CI/CD pipeline,
 Performance tuning: latency targets p95 < 220ms, throughput 1500 rps, scalability via autoscaling, cache, cdn, load balancing and query optimization with indexing.
 """
 
-def test_rescore_endpoint_basic():
+@pytest.mark.asyncio
+async def test_rescore_endpoint_basic(async_client):
     # Create assessment
-    resp = client.post("/api/assessments", json={"name": "rescore-test"})
+    resp = await async_client.post("/api/assessments", json={"name": "rescore-test"})
     assert resp.status_code == 200
     aid = resp.json()["id"]
 
     # Upload architecture document
     files = [("files", ("arch.txt", ARCH_DOC, "text/plain"))]
-    up_resp = client.post(f"/api/assessments/{aid}/documents", files=files)
+    up_resp = await async_client.post(f"/api/assessments/{aid}/documents", files=files)
     assert up_resp.status_code == 200
     assert len(up_resp.json()) == 1
 
     # Perform rescore (without full analysis lifecycle)
-    rs_resp = client.post(f"/api/assessments/{aid}/rescore")
+    rs_resp = await async_client.post(f"/api/assessments/{aid}/rescore")
     assert rs_resp.status_code == 200, rs_resp.text
     data = rs_resp.json()
 
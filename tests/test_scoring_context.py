@@ -1,7 +1,16 @@
 """(Relocated) Context-aware scoring verification with positive negations."""
 import sys
+
+import backend.server as server
 sys.path.insert(0, r'C:\_Projects\MAF\wara\azure-well-architected-agents')
-from backend.server import _calculate_conservative_score
+from backend.server import (
+    ACTUAL_GAP_PATTERNS,
+    CRITICAL_GAP_PATTERNS,
+    _calculate_conservative_score,
+    _count_critical_gaps,
+    _compute_conservative_score,
+    _count_gap_mentions,
+)
 
 good_arch = """
 No single point of failure; automated failover; Key Vault secrets; zero trust; availability zones.
@@ -18,5 +27,59 @@ def test_good_vs_bad():
     assert g_conf in ("Medium", "High")
     assert b_conf in ("Low", "Medium")
 
+def _count_computations(monkeypatch):
+    """Give the memo an empty cache and return the list each real computation appends to."""
+    calls = []
+    real = server._compute_conservative_score
+    def counting(corpus, code, name, corpus_lower=None):
+        calls.append((corpus, code))
+        return real(corpus, code, name, corpus_lower)
+    monkeypatch.setattr(server, "_CONSERVATIVE_SCORE_CACHE", {})
+    monkeypatch.setattr(server, "_compute_conservative_score", counting)
+    return calls
+
+def test_score_is_memoized_and_isolated(monkeypatch):
+    calls = _count_computations(monkeypatch)
+    first = _calculate_conservative_score(good_arch, 'reliability', 'Reliability')
+    # Mutating a returned result must not leak into later cache hits
+    first[6]["steps"].clear()
+    second = _calculate_conservative_score(good_arch, 'reliability', 'Reliability')
+    assert len(calls) == 1
+    assert second[0] == first[0]
+    assert second[6]["steps"]
+    _calculate_conservative_score(good_arch, 'security', 'Security')
+    assert len(calls) == 2
+
+def test_score_cache_evicts_oldest_at_max(monkeypatch):
+    calls = _count_computations(monkeypatch)
+    monkeypatch.setattr(server, "CONSERVATIVE_SCORE_CACHE_MAX", 2)
+    corpora = [good_arch, bad_arch, good_arch + bad_arch]
+    for corpus in corpora:
+        _calculate_conservative_score(corpus, 'reliability', 'Reliability')
+    assert len(server._CONSERVATIVE_SCORE_CACHE) == 2
+    _calculate_conservative_score(corpora[2], 'reliability', 'Reliability')
+    assert len(calls) == 3
+    _calculate_conservative_score(corpora[0], 'reliability', 'Reliability')
+    assert len(calls) == 4
+    assert calls[-1][0] is corpora[0]
+
+def test_gap_count_matches_per_pattern_count():
+    corpus = (bad_arch.lower() + " disabledisabled; no public endpoint disabled; "
+              "redundancy not configuredundancy not configured")
+    expected = sum(corpus.replace("no public", "").count(p) for p in ACTUAL_GAP_PATTERNS)
+    assert _count_gap_mentions(corpus) == expected
+    assert _count_gap_mentions(good_arch.lower()) == 0
+
+def test_critical_gap_count_matches_per_pattern_count():
+    corpus = bad_arch.lower() + " no backup policy; backup missingbackup missing; not multi-region"
+    expected = sum(corpus.count(p) for p in CRITICAL_GAP_PATTERNS)
+    assert expected > 3
+    assert _count_critical_gaps(corpus) == expected
+
+def test_precomputed_lowercase_corpus_gives_same_score():
+    for code, name in (('reliability', 'Reliability'), ('security', 'Security')):
+        assert _compute_conservative_score(bad_arch, code, name, bad_arch.lower()) == \
+            _compute_conservative_score(bad_arch, code, name)
+
 if __name__ == '__main__':  # pragma: no cover
     test_good_vs_bad(); print('✅ scoring context quick check passed')
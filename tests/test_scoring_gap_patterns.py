@@ -0,0 +1,37 @@
+"""Gap pattern matching in the maturity scorer (backend.utils.scoring.scoring)."""
+
+from backend.utils.scoring.scoring import _compile_pattern, _evaluate_gaps, _phrase_present
+
+
+def _matched(text, patterns):
+    result = _evaluate_gaps(text, [{"id": "G1", "patterns": patterns}])[0]
+    return result["matchedPatterns"]
+
+
+def test_plain_phrase_tolerates_whitespace_and_case():
+    text = "There is NO   disaster\nrecovery plan documented."
+    assert _matched(text, ["no disaster recovery"]) == ["no disaster recovery"]
+
+
+def test_plain_phrase_requires_word_boundaries():
+    assert _matched("We run no backups at all", ["no backup"]) == []
+    assert _matched("We run no backup at all", ["no backup"]) == ["no backup"]
+
+
+def test_regex_pattern_used_as_is():
+    assert _matched("single region only", ["single[- ]region"]) == ["single[- ]region"]
+    assert _matched("multi region", ["(single|one) region"]) == []
+
+
+def test_word_boundary_is_unicode_aware():
+    # re2's \b is ASCII-only; non-ASCII text must get stdlib re semantics
+    assert not _phrase_present("backupé nightly", "backup")
+    assert _phrase_present("backup nightly", "backup")
+    assert _matched("no backupé policy", ["no backup"]) == []
+    assert _matched("NO BACKUP policy", ["no backup"]) == ["no backup"]
+
+
+def test_pattern_rejected_by_re2_falls_back_quietly(capfd):
+    regex = _compile_pattern(r"no (?=backup)", ignorecase=True)
+    assert regex.search("We have NO backup") is not None
+    assert capfd.readouterr().err == ""
@@ -1,15 +1,21 @@
 """(Relocated) Quick reliability concept coverage smoke test."""
 
+from backend.server import _keyword_hits
+
+
 def test_concept_coverage_smoke():
     corpus_minimal = "We use Azure VMs for hosting."
     corpus_moderate = (
         "Our architecture uses Azure Kubernetes Service with multi-region deployment. "
-        "We implement Key Vault for secret management and Azure Monitor for alerting."
+        "We implement Key Vault for secret management and Azure Monitor for alerting. "
+        "Nightly backups and automatic failover protect the primary database."
     )
-    concepts = ["redundancy", "failover", "backup", "disaster recovery", "availability"]
-    hits_min = sum(1 for c in concepts if c in corpus_minimal.lower())
-    hits_mod = sum(1 for c in concepts if c in corpus_moderate.lower())
-    assert hits_mod >= hits_min
+    concepts = {"redundancy", "failover", "backup", "disaster recovery", "availability"}
+    # Lowercase each corpus once and match with the scorer's own keyword pass
+    hits_min = len(_keyword_hits(corpus_minimal.lower(), "reliability") & concepts)
+    hits_mod = len(_keyword_hits(corpus_moderate.lower(), "reliability") & concepts)
+    assert hits_min == 0
+    assert hits_mod > hits_min
 
 if __name__ == '__main__':  # pragma: no cover
     test_concept_coverage_smoke(); print('✅ scoring quick smoke passed')
@@ -4,20 +4,39 @@ from __future__ import annotations
 
 import asyncio
 import json
+from functools import cache, cached_property
 from pathlib import Path
 from typing import Any, Dict
 
-import importlib
 import pytest
 
 import sys
 
+try:  # Optional fast JSON (same fallback pattern as the agents)
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore
+
 _SRC_PATH = Path(__file__).resolve().parent.parent / "src"
 if str(_SRC_PATH) not in sys.path:
     sys.path.insert(0, str(_SRC_PATH))
 
-SecurityAgent = None  # type: ignore
-DOMAIN_TITLES: Dict[str, str] = {}
+
+class _FakeResponse:
+    """Agent run result carrying the structured payload as ``.data``.
+
+    ``.text`` (what the agent parses) is rendered from ``.data`` on first read
+    and cached, so the payload is serialized at most once.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+
+    @cached_property
+    def text(self) -> str:
+        if orjson is not None:
+            return orjson.dumps(self.data).decode("utf-8")
+        return json.dumps(self.data)
 
 
 class _FakeLLMAgent:
@@ -25,36 +44,27 @@ class _FakeLLMAgent:
 
     def __init__(self, payload: Dict[str, Any]):
         self._payload = payload
+        self._response = _FakeResponse(payload)
 
     async def run(self, prompt: str):  # noqa: ARG002 - prompt unused in fake
-        class Response:
-            text: str
-
-        resp = Response()
-        resp.text = json.dumps(self._payload)
         await asyncio.sleep(0)
-        return resp
+        return self._response
 
 
-@pytest.mark.asyncio
-async def test_security_agent_normalizes_recommendations(monkeypatch):
-    global SecurityAgent, DOMAIN_TITLES
+@cache
+def _load_security_agent():
+    """Import the security agent stack on first use so collection never loads it."""
+    from app.agents import pillar_agent_base
+    from app.agents.security_agent import SecurityAgent
+    from app.agents.security_constants import DOMAIN_TITLES
 
-    if SecurityAgent is None:
-        try:
-            pillar_agent_base = importlib.import_module("app.agents.pillar_agent_base")
-            security_constants = importlib.import_module("app.agents.security_constants")
-            security_agent_module = importlib.import_module("app.agents.security_agent")
-        except SystemExit:
-            pytest.skip("Agent framework not installed; skipping security agent test")
+    return SecurityAgent, DOMAIN_TITLES, pillar_agent_base
 
-        monkeypatch.setattr(pillar_agent_base, "AGENT_FRAMEWORK_AVAILABLE", True)
-        SecurityAgent = getattr(security_agent_module, "SecurityAgent")
-        DOMAIN_TITLES = security_constants.DOMAIN_TITLES
 
-    fake_json: Dict[str, Any] = {
+def _fake_payload(domain_titles: Dict[str, str]) -> Dict[str, Any]:
+    return {
         "overall_score": 76,
-        "domain_scores": {code: {"score": 70, "title": title} for code, title in DOMAIN_TITLES.items()},
+        "domain_scores": {code: {"score": 70, "title": title} for code, title in domain_titles.items()},
         "recommendations": [
             {
                 "title": "Enforce MFA",
@@ -73,39 +83,56 @@ async def test_security_agent_normalizes_recommendations(monkeypatch):
         ],
     }
 
-    async def _fake_init(self):  # type: ignore[override]
-        await asyncio.sleep(0)
-        self.agent = _FakeLLMAgent(fake_json)
 
-    monkeypatch.setattr(SecurityAgent, "_initialize_agent", _fake_init, raising=True)
+async def _fake_mcp(service: str, topic: str):  # noqa: ARG001
+    await asyncio.sleep(0)
+    return [
+        {
+            "title": "Design review checklist for Security",
+            "url": "https://learn.microsoft.com/azure/well-architected/security/checklist",
+        },
+        {
+            "title": "Security design principles",
+            "url": "https://learn.microsoft.com/azure/well-architected/security/principles",
+        },
+    ]
 
-    async def _fake_mcp(service: str, topic: str):  # noqa: ARG001
-        await asyncio.sleep(0)
-        return [
-            {
-                "title": "Design review checklist for Security",
-                "url": "https://learn.microsoft.com/azure/well-architected/security/checklist",
-            },
-            {
-                "title": "Security design principles",
-                "url": "https://learn.microsoft.com/azure/well-architected/security/principles",
-            },
-        ]
 
+@pytest.fixture(scope="module")
+def security_agent():
+    """SecurityAgent wired to the fake LLM/MCP, constructed once per module.
+
+    The fake LLM agent is assigned up front, so ``assess_architecture`` never
+    calls ``_initialize_agent`` and the instance carries no per-run state.
+    """
     try:
-        agent = SecurityAgent(enable_mcp=True)
+        SecurityAgent, DOMAIN_TITLES, pillar_agent_base = _load_security_agent()
     except SystemExit:
-        pytest.skip("Agent framework initialization failed; skipping security agent test")
-    if agent.mcp_manager:
-        monkeypatch.setattr(agent.mcp_manager, "get_service_documentation", _fake_mcp, raising=True)
+        pytest.skip("Agent framework not installed; skipping security agent test")
+
+    # Module scope cannot use the function-scoped ``monkeypatch`` fixture
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(pillar_agent_base, "AGENT_FRAMEWORK_AVAILABLE", True)
+        try:
+            agent = SecurityAgent(enable_mcp=True)
+        except SystemExit:
+            pytest.skip("Agent framework initialization failed; skipping security agent test")
+        agent.agent = _FakeLLMAgent(_fake_payload(DOMAIN_TITLES))
+        if agent.mcp_manager:
+            mp.setattr(agent.mcp_manager, "get_service_documentation", _fake_mcp, raising=True)
+        yield agent
+
+
+@pytest.mark.asyncio
+@pytest.mark.slow
+async def test_security_agent_normalizes_recommendations(security_agent, security_architecture):
+    _, DOMAIN_TITLES, _ = _load_security_agent()
 
-    sample_architecture = Path("tests/fixtures/security_sample_architecture.txt").read_text(encoding="utf-8")
-    assessment = await agent.assess_architecture(sample_architecture)
+    assessment = await security_agent.assess_architecture(security_architecture)
 
     assert assessment.overall_score == 76
     assert len(assessment.domain_scores) == len(DOMAIN_TITLES)
-    for code, title in DOMAIN_TITLES.items():
-        assert assessment.domain_scores[code]["title"] == title
+    assert {code: assessment.domain_scores[code]["title"] for code in DOMAIN_TITLES} == DOMAIN_TITLES
 
     assert assessment.recommendations, "Expected recommendations list to be populated"
     assert all("severity" in rec for rec in assessment.recommendations)